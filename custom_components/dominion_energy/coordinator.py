@@ -66,7 +66,11 @@ from .const import (
     DOMAIN,
     UPDATE_INTERVAL_MINUTES,
 )
-from .rates import VA_SCHEDULE_1, calculate_schedule1_interval_cost
+from .rates import (
+    VA_SCHEDULE_1,
+    calculate_schedule1_interval_cost,
+    calculate_schedule1_period_cost_by_month,
+)
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -264,9 +268,15 @@ class DominionEnergyCoordinator(DataUpdateCoordinator[DominionEnergyData]):
                 _LOGGER.warning("Could not fetch bill forecast: %s", err)
                 bill_forecast = None
 
-            # Calculate costs
-            daily_cost = self._calculate_cost(intervals, bill_forecast)
-            monthly_cost = self._calculate_cost(monthly_intervals, bill_forecast)
+            # Calculate costs in the executor: if numba is installed (it is
+            # optional, not a requirement), the Schedule 1 batch kernel is
+            # compiled on first use and would otherwise block the event loop
+            daily_cost = await self.hass.async_add_executor_job(
+                self._calculate_cost, intervals, bill_forecast
+            )
+            monthly_cost = await self.hass.async_add_executor_job(
+                self._calculate_cost, monthly_intervals, bill_forecast
+            )
 
             latest = intervals[-1] if intervals else None
 
@@ -320,24 +330,19 @@ class DominionEnergyCoordinator(DataUpdateCoordinator[DominionEnergyData]):
 
         if cost_mode == COST_MODE_SCHEDULE_1:
             # VA Schedule 1 with cumulative kWh tracking for tiered pricing
-            cost = 0.0
-            cumulative_kwh = 0.0
             # Estimate billing period days from interval span
             if len(intervals) >= 2:
                 span = intervals[-1].timestamp.date() - intervals[0].timestamp.date()
                 billing_days = max(span.days, 1)
             else:
                 billing_days = 30
-            for interval in intervals:
-                cost += calculate_schedule1_interval_cost(
-                    interval.consumption,
-                    interval.timestamp,
-                    cumulative_kwh,
-                    VA_SCHEDULE_1,
-                    billing_period_days=billing_days,
-                )
-                cumulative_kwh += interval.consumption
-            return round(cost, 2)
+            costs = calculate_schedule1_period_cost_by_month(
+                [interval.consumption for interval in intervals],
+                [interval.timestamp.month for interval in intervals],
+                VA_SCHEDULE_1,
+                billing_period_days=billing_days,
+            )
+            return round(float(costs.sum()), 2)
 
         if cost_mode == COST_MODE_API and bill_forecast:
             # Derive rate from last bill: charges / usage
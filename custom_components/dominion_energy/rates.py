@@ -2,10 +2,46 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from datetime import datetime
+import math
+from array import array
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timedelta
 from enum import Enum
 
+import numpy as np
+
+try:
+    from numba import njit
+
+    _HAS_NUMBA = True
+except ImportError:  # numba is optional; period costs then use NumPy arrays
+    _HAS_NUMBA = False
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """Stand-in for numba.njit that returns the function unchanged."""
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+INTERVALS_PER_DAY = 48  # 30-minute AMI intervals
+INTERVAL_DURATION = timedelta(minutes=30)
+
+
+# Layout of RateSchedule._hot. The summer block starts at 0, the winter block
+# at _P_WINTER, and both use the same offsets within the block.
+_P_DIST_BOUNDARY = 0
+_P_DIST_UNDER = 1
+_P_DIST_OVER = 2
+_P_GEN_BOUNDARY = 3
+_P_GEN_UNDER = 4
+_P_GEN_OVER = 5
+_P_WINTER = 6
+_P_FLAT_RATE = 12
+
 
 class Season(Enum):
     """Billing season."""
@@ -14,7 +50,7 @@ class Season(Enum):
     WINTER = "winter"  # Oct-May
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TieredRate:
     """Rate with a kWh boundary (e.g., first 800 kWh vs. over 800 kWh)."""
 
@@ -23,7 +59,7 @@ class TieredRate:
     rate_over: float  # $/kWh for usage > boundary
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SeasonalTieredRates:
     """Summer and winter tiered rates for a component."""
 
@@ -31,7 +67,7 @@ class SeasonalTieredRates:
     winter: TieredRate
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FlatRider:
     """A flat per-kWh rider/surcharge."""
 
@@ -39,7 +75,7 @@ class FlatRider:
     rate: float  # $/kWh
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConsumptionTaxTier:
     """A consumption tax tier with kWh range."""
 
@@ -48,8 +84,42 @@ class ConsumptionTaxTier:
     rate: float  # $/kWh
 
 
-@dataclass(frozen=True)
-class RateSchedule:
+class _RateScheduleDerived:
+    """Slots for constants derived from a RateSchedule's tariff fields.
+
+    Kept out of the dataclass field list so fields(), asdict() and astuple()
+    only see the tariff itself.
+    """
+
+    __slots__ = (
+        "_compiled_kernel",
+        "_customer_charge_per_interval_base",
+        "_flat_rate_per_kwh",
+        "_hot",
+        "_rider_rates",
+        "_tax_lower",
+        "_tax_rate",
+        "_tax_upper",
+        "_total_rider_rate",
+    )
+
+    # Precomputed once so the per-interval path doesn't walk the rider list
+    # or re-derive the customer charge split
+    _rider_rates: np.ndarray
+    _tax_lower: np.ndarray
+    _tax_upper: np.ndarray
+    _tax_rate: np.ndarray
+    _total_rider_rate: float
+    _hot: np.ndarray
+    _flat_rate_per_kwh: float
+    _customer_charge_per_interval_base: float
+    # Interval cost function specialized for this schedule by _emit_specialized
+    # (not picklable, so RateSchedule.__reduce__ rebuilds it from the tariff)
+    _compiled_kernel: Callable[[float, float, bool, float], float]
+
+
+@dataclass(frozen=True, slots=True)
+class RateSchedule(_RateScheduleDerived):
     """Complete rate schedule for a Dominion Energy tariff."""
 
     name: str
@@ -61,6 +131,189 @@ class RateSchedule:
     riders: list[FlatRider] = field(default_factory=list)
     consumption_tax_tiers: list[ConsumptionTaxTier] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        """Precompute aggregates used on every interval."""
+        # Parallel float64 arrays of the rider and tax tier lists for the
+        # vectorized period calculation. Read-only, like the schedule itself.
+        tiers = self.consumption_tax_tiers
+        for name, values in (
+            ("_rider_rates", (rider.rate for rider in self.riders)),
+            ("_tax_lower", (tier.lower_kwh for tier in tiers)),
+            ("_tax_upper", (tier.upper_kwh for tier in tiers)),
+            ("_tax_rate", (tier.rate for tier in tiers)),
+        ):
+            buffer = np.fromiter(values, dtype=np.float64)
+            buffer.setflags(write=False)
+            object.__setattr__(self, name, buffer)
+        object.__setattr__(self, "_total_rider_rate", float(self._rider_rates.sum()))
+        # Transmission and riders are all flat $/kWh and always apply together
+        object.__setattr__(
+            self,
+            "_flat_rate_per_kwh",
+            self.transmission_rate + self._total_rider_rate,
+        )
+        # Scalar tariff constants in one contiguous buffer, laid out as _P_*
+        params: list[float] = []
+        for dist_rate, gen_rate in (
+            (self.distribution.summer, self.generation.summer),
+            (self.distribution.winter, self.generation.winter),
+        ):
+            for rate in (dist_rate, gen_rate):
+                params += (rate.boundary_kwh, rate.rate_under, rate.rate_over)
+        params.append(self._flat_rate_per_kwh)
+        hot = np.array(params, dtype=np.float64)
+        hot.setflags(write=False)
+        object.__setattr__(self, "_hot", hot)
+        # Customer charge per interval for a one-day period; divide by days
+        object.__setattr__(
+            self,
+            "_customer_charge_per_interval_base",
+            self.customer_charge / INTERVALS_PER_DAY,
+        )
+        object.__setattr__(self, "_compiled_kernel", _emit_specialized(self))
+
+    def __reduce__(self) -> tuple[type[RateSchedule], tuple[object, ...]]:
+        """Pickle the tariff fields only; derived constants are rebuilt."""
+        return (
+            type(self),
+            tuple(getattr(self, f.name) for f in fields(self)),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ScheduleContext:
+    """Rate schedule constants resolved for one billing period.
+
+    Construct once per billing period and pass to
+    calculate_schedule1_interval_cost_ctx for each interval.
+    """
+
+    schedule: RateSchedule
+    billing_period_days: int = 30
+    cc_per_interval: float = field(init=False)  # prorated customer charge
+
+    def __post_init__(self) -> None:
+        """Prorate the customer charge over the billing period."""
+        object.__setattr__(
+            self,
+            "cc_per_interval",
+            self.schedule._customer_charge_per_interval_base / self.billing_period_days,
+        )
+
+
+def _float_literal(value: float) -> str:
+    """Return a source expression that evaluates to exactly value."""
+    value = float(value)
+    if math.isfinite(value):
+        return repr(value)
+    # repr() of inf/nan is a bare name the generated code can't resolve
+    return f"float({str(value)!r})"
+
+
+def _emit_tiered(name: str, tiered_rate: TieredRate, indent: str) -> list[str]:
+    """Emit source computing `name` as the branchless tiered cost."""
+    boundary = _float_literal(tiered_rate.boundary_kwh)
+    rate_under = _float_literal(tiered_rate.rate_under)
+    rate_over = _float_literal(tiered_rate.rate_over)
+    return [
+        f"{indent}kwh_under = max(0.0, min(interval_kwh, {boundary} - cumulative_before))",
+        f"{indent}{name} = kwh_under * {rate_under} + (interval_kwh - kwh_under) * {rate_over}",
+    ]
+
+
+def _combined_tiered_rate(
+    dist_rate: TieredRate, gen_rate: TieredRate
+) -> TieredRate | None:
+    """Merge distribution and generation rates that share a tier boundary.
+
+    With a common boundary both components split each interval identically,
+    so their sum is a single tiered rate with the rates added together.
+    Returns None when the boundaries differ.
+    """
+    if dist_rate.boundary_kwh != gen_rate.boundary_kwh:
+        return None
+    return TieredRate(
+        boundary_kwh=dist_rate.boundary_kwh,
+        rate_under=dist_rate.rate_under + gen_rate.rate_under,
+        rate_over=dist_rate.rate_over + gen_rate.rate_over,
+    )
+
+
+def _emit_energy(dist_rate: TieredRate, gen_rate: TieredRate, indent: str) -> list[str]:
+    """Emit source computing `energy_cost` (distribution plus generation)."""
+    combined = _combined_tiered_rate(dist_rate, gen_rate)
+    if combined is not None:
+        return _emit_tiered("energy_cost", combined, indent)
+    return [
+        *_emit_tiered("dist_cost", dist_rate, indent),
+        *_emit_tiered("gen_cost", gen_rate, indent),
+        f"{indent}energy_cost = dist_cost + gen_cost",
+    ]
+
+
+def _emit_tax_term(tier: ConsumptionTaxTier, first: bool) -> str:
+    """Emit the tax expression for the part of the interval inside a tier.
+
+    The interval is taxed over [tax_start, tax_end), which already begins at
+    or above the first tier's lower bound.
+    """
+    upper = "tax_end"
+    if tier.upper_kwh != float("inf"):
+        upper = f"min(tax_end, {_float_literal(tier.upper_kwh)})"
+    lower = "tax_start"
+    if not first:
+        lower = f"max(tax_start, {_float_literal(tier.lower_kwh)})"
+    return f"{_float_literal(tier.rate)} * max(0.0, {upper} - {lower})"
+
+
+def _emit_specialized(
+    schedule: RateSchedule,
+) -> Callable[[float, float, bool, float], float]:
+    """Generate an interval cost function with the schedule's rates inlined.
+
+    The tariff is fixed once the schedule is built, so every rate, boundary
+    and tax tier is emitted as a numeric literal and the tax tiers are
+    unrolled into the closed-form sum of each tier's share. The result takes
+    (interval_kwh, cumulative_before, is_summer, cc_per_interval) and expects
+    interval_kwh > 0.
+    """
+    tax_tiers = schedule.consumption_tax_tiers
+    lines = [
+        "def kernel(interval_kwh, cumulative_before, is_summer, cc_per_interval):",
+    ]
+    if tax_tiers:
+        # As in calculate_consumption_tax, a position below the first tier
+        # moves up to it before the interval is split across tiers
+        first_lower = _float_literal(tax_tiers[0].lower_kwh)
+        lines += [
+            f"    tax_start = max(cumulative_before, {first_lower})",
+            "    tax_end = tax_start + interval_kwh",
+        ]
+    lines += [
+        "    if is_summer:",
+        *_emit_energy(
+            schedule.distribution.summer, schedule.generation.summer, " " * 8
+        ),
+        "    else:",
+        *_emit_energy(
+            schedule.distribution.winter, schedule.generation.winter, " " * 8
+        ),
+        "    return (",
+        "        energy_cost",
+        f"        + interval_kwh * {_float_literal(schedule._flat_rate_per_kwh)}",
+        *(
+            f"        + {_emit_tax_term(tier, index == 0)}"
+            for index, tier in enumerate(tax_tiers)
+        ),
+        "        + cc_per_interval",
+        "    )",
+    ]
+    namespace: dict[str, Callable[[float, float, bool, float], float]] = {}
+    exec(  # noqa: S102 - source is generated from numeric schedule constants
+        compile("\n".join(lines), f"<{schedule.name} kernel>", "exec"), namespace
+    )
+    return namespace["kernel"]
+
 
 # Virginia Residential Schedule 1 — effective 2026-01-01
 # Source: bill-calculator-worksheet-va.xlsx (last updated 2025-12-19)
@@ -69,12 +322,12 @@ VA_SCHEDULE_1 = RateSchedule(
     effective_date="2026-01-01",
     customer_charge=7.58,
     distribution=SeasonalTieredRates(
-        summer=TieredRate(boundary_kwh=800, rate_under=0.03569, rate_over=0.023596),
-        winter=TieredRate(boundary_kwh=800, rate_under=0.03569, rate_over=0.023596),
+        summer=TieredRate(boundary_kwh=800.0, rate_under=0.03569, rate_over=0.023596),
+        winter=TieredRate(boundary_kwh=800.0, rate_under=0.03569, rate_over=0.023596),
     ),
     generation=SeasonalTieredRates(
-        summer=TieredRate(boundary_kwh=800, rate_under=0.031212, rate_over=0.046243),
-        winter=TieredRate(boundary_kwh=800, rate_under=0.030064, rate_over=0.026965),
+        summer=TieredRate(boundary_kwh=800.0, rate_under=0.031212, rate_over=0.046243),
+        winter=TieredRate(boundary_kwh=800.0, rate_under=0.030064, rate_over=0.026965),
     ),
     transmission_rate=0.0097,
     riders=[
@@ -96,9 +349,9 @@ VA_SCHEDULE_1 = RateSchedule(
         FlatRider("Sales&Use", 0.000921),
     ],
     consumption_tax_tiers=[
-        ConsumptionTaxTier(lower_kwh=0, upper_kwh=2500, rate=0.001565),
-        ConsumptionTaxTier(lower_kwh=2500, upper_kwh=50000, rate=0.001055),
-        ConsumptionTaxTier(lower_kwh=50000, upper_kwh=float("inf"), rate=0.000845),
+        ConsumptionTaxTier(lower_kwh=0.0, upper_kwh=2500.0, rate=0.001565),
+        ConsumptionTaxTier(lower_kwh=2500.0, upper_kwh=50000.0, rate=0.001055),
+        ConsumptionTaxTier(lower_kwh=50000.0, upper_kwh=float("inf"), rate=0.000845),
     ],
 )
 
@@ -110,6 +363,29 @@ def get_season(month: int) -> Season:
     return Season.WINTER
 
 
+def resolve_seasonal_rates(
+    schedule: RateSchedule,
+    season: Season,
+) -> tuple[TieredRate, TieredRate]:
+    """Select the (distribution, generation) tiered rates for a season.
+
+    The season only changes at month boundaries, so callers iterating over a
+    billing period should resolve the rates once per season rather than per
+    interval.
+    """
+    return _seasonal_rates(schedule, season == Season.SUMMER)
+
+
+def _seasonal_rates(
+    schedule: RateSchedule,
+    is_summer: bool,
+) -> tuple[TieredRate, TieredRate]:
+    """Select the (distribution, generation) tiered rates by a summer flag."""
+    if is_summer:
+        return schedule.distribution.summer, schedule.generation.summer
+    return schedule.distribution.winter, schedule.generation.winter
+
+
 def calculate_tiered_cost(
     interval_kwh: float,
     cumulative_before: float,
@@ -118,7 +394,10 @@ def calculate_tiered_cost(
     """Calculate cost for a single interval using tiered pricing.
 
     Handles the case where cumulative usage straddles the tier boundary
-    within this interval.
+    within this interval. Written without branches for consumption: the kWh
+    below the boundary is clamped to zero once cumulative usage is past it.
+    A negative (net export) reading is priced entirely in the tier its end
+    falls in.
 
     Args:
         interval_kwh: kWh consumed in this interval.
@@ -128,18 +407,13 @@ def calculate_tiered_cost(
     Returns:
         Cost in dollars for this interval.
     """
-    boundary = tiered_rate.boundary_kwh
-    cumulative_after = cumulative_before + interval_kwh
-
-    if cumulative_after <= boundary:
-        # All usage in lower tier
-        return interval_kwh * tiered_rate.rate_under
-    if cumulative_before >= boundary:
-        # All usage in upper tier
+    if interval_kwh < 0:
+        if cumulative_before + interval_kwh <= tiered_rate.boundary_kwh:
+            return interval_kwh * tiered_rate.rate_under
         return interval_kwh * tiered_rate.rate_over
-
-    # Straddles the boundary
-    kwh_under = boundary - cumulative_before
+    kwh_under = max(
+        0.0, min(interval_kwh, tiered_rate.boundary_kwh - cumulative_before)
+    )
     kwh_over = interval_kwh - kwh_under
     return kwh_under * tiered_rate.rate_under + kwh_over * tiered_rate.rate_over
 
@@ -199,51 +473,366 @@ def calculate_schedule1_interval_cost(
         schedule: The rate schedule to use.
         billing_period_days: Length of billing period in days (for prorating customer charge).
 
+    Returns:
+        Total cost in dollars for this interval.
+    """
+    return calculate_schedule1_interval_cost_by_month(
+        interval_kwh,
+        interval_dt.month,
+        cumulative_before,
+        schedule,
+        billing_period_days,
+    )
+
+
+def calculate_schedule1_interval_cost_by_month(
+    interval_kwh: float,
+    month: int,
+    cumulative_before: float,
+    schedule: RateSchedule,
+    billing_period_days: int = 30,
+) -> float:
+    """Calculate full Schedule 1 cost for a single 30-minute interval.
+
+    Same as calculate_schedule1_interval_cost, but takes the month number
+    directly so callers don't need a datetime per interval.
+
+    Args:
+        interval_kwh: kWh consumed in this interval.
+        month: Month of the interval (1-12, used for season determination).
+        cumulative_before: Total kWh consumed before this interval in the billing period.
+        schedule: The rate schedule to use.
+        billing_period_days: Length of billing period in days (for prorating customer charge).
+
     Returns:
         Total cost in dollars for this interval.
     """
     if interval_kwh <= 0:
         return 0.0
 
-    season = get_season(interval_dt.month)
+    return schedule._compiled_kernel(
+        interval_kwh,
+        cumulative_before,
+        6 <= month <= 9,  # is_summer (Jun-Sep)
+        # Prorated customer charge: $7.58/month spread across all intervals
+        schedule._customer_charge_per_interval_base / billing_period_days,
+    )
+
+
+def calculate_schedule1_interval_cost_ctx(
+    interval_kwh: float,
+    interval_dt: datetime,
+    cumulative_before: float,
+    ctx: ScheduleContext,
+) -> float:
+    """Calculate full Schedule 1 cost for a single 30-minute interval.
 
-    # Distribution (tiered)
-    dist_rate = (
-        schedule.distribution.summer
-        if season == Season.SUMMER
-        else schedule.distribution.winter
+    Same as calculate_schedule1_interval_cost, with the schedule and billing
+    period supplied as a precomputed ScheduleContext.
+
+    Args:
+        interval_kwh: kWh consumed in this interval.
+        interval_dt: Timestamp of the interval (used for season determination).
+        cumulative_before: Total kWh consumed before this interval in the billing period.
+        ctx: Schedule constants for the billing period.
+
+    Returns:
+        Total cost in dollars for this interval.
+    """
+    if interval_kwh <= 0:
+        return 0.0
+    return ctx.schedule._compiled_kernel(
+        interval_kwh,
+        cumulative_before,
+        6 <= interval_dt.month <= 9,  # is_summer (Jun-Sep)
+        ctx.cc_per_interval,
     )
-    dist_cost = calculate_tiered_cost(interval_kwh, cumulative_before, dist_rate)
 
-    # Generation (tiered)
-    gen_rate = (
-        schedule.generation.summer
-        if season == Season.SUMMER
-        else schedule.generation.winter
+
+def _interval_months(start_dt: datetime, count: int) -> np.ndarray:
+    """Return the calendar month of each consecutive 30-minute interval.
+
+    Walks month boundaries rather than individual intervals, so the cost is
+    proportional to the number of months spanned, not the number of intervals.
+    """
+    months = np.empty(count, dtype=np.int8)
+    index = 0
+    current = start_dt
+    while index < count:
+        if current.month == 12:
+            next_month = current.replace(
+                year=current.year + 1,
+                month=1,
+                day=1,
+                hour=0,
+                minute=0,
+                second=0,
+                microsecond=0,
+            )
+        else:
+            next_month = current.replace(
+                month=current.month + 1,
+                day=1,
+                hour=0,
+                minute=0,
+                second=0,
+                microsecond=0,
+            )
+        # Number of intervals starting before the next month begins (ceiling)
+        intervals_left = -((current - next_month) // INTERVAL_DURATION)
+        end = min(index + intervals_left, count)
+        months[index:end] = current.month
+        current += intervals_left * INTERVAL_DURATION
+        index = end
+    return months
+
+
+# NumPy array kernels, used for period costs when numba is not installed
+def _period_kernel(
+    kwh: np.ndarray,
+    cumulative_before: np.ndarray,
+    boundary: float,
+    rate_under: float,
+    rate_over: float,
+) -> np.ndarray:
+    """Vectorized equivalent of calculate_tiered_cost over many intervals."""
+    kwh_under = np.minimum(np.maximum(boundary - cumulative_before, 0.0), kwh)
+    return kwh_under * rate_under + (kwh - kwh_under) * rate_over
+
+
+def _tax_kernel(
+    kwh: np.ndarray,
+    cumulative_before: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    rate: np.ndarray,
+) -> np.ndarray:
+    """Vectorized equivalent of calculate_consumption_tax over many intervals."""
+    tax = np.zeros_like(kwh)
+    if rate.shape[0] == 0:
+        return tax
+    # Like the scalar loop, a position below the first tier (negative
+    # cumulative kWh) moves up to it and the whole interval is taxed from there
+    start = np.maximum(cumulative_before, lower[0])
+    end = start + kwh
+    for i in range(rate.shape[0]):
+        # kWh of each interval that falls inside this tier
+        kwh_in_tier = np.minimum(end, upper[i]) - np.maximum(start, lower[i])
+        tax += np.maximum(kwh_in_tier, 0.0) * rate[i]
+    return tax
+
+
+# Takes only scalars and float64 arrays (no dataclasses) so that numba can
+# compile it. fastmath is deliberately off: the top consumption tax tier is
+# bounded by float("inf").
+@njit(cache=True)
+def _schedule1_native_kernel(
+    kwh: np.ndarray,
+    summer: np.ndarray,
+    cumulative_start: float,
+    params: np.ndarray,
+    tax_lower: np.ndarray,
+    tax_upper: np.ndarray,
+    tax_rate: np.ndarray,
+    cc_per_interval: float,
+    out: np.ndarray,
+) -> None:
+    """Write the cost of each interval into out in a single pass.
+
+    Loop form of the period calculation, used in place of the array kernels
+    when numba can compile it to native code. params is RateSchedule._hot.
+    """
+    cumulative_before = cumulative_start
+    for i in range(kwh.shape[0]):
+        interval_kwh = kwh[i]
+        cumulative_after = cumulative_before + interval_kwh
+        if interval_kwh > 0:
+            base = 0 if summer[i] else _P_WINTER
+            kwh_under = max(
+                0.0,
+                min(interval_kwh, params[base + _P_DIST_BOUNDARY] - cumulative_before),
+            )
+            cost = (
+                kwh_under * params[base + _P_DIST_UNDER]
+                + (interval_kwh - kwh_under) * params[base + _P_DIST_OVER]
+            )
+            kwh_under = max(
+                0.0,
+                min(interval_kwh, params[base + _P_GEN_BOUNDARY] - cumulative_before),
+            )
+            cost += (
+                kwh_under * params[base + _P_GEN_UNDER]
+                + (interval_kwh - kwh_under) * params[base + _P_GEN_OVER]
+            )
+            cost += interval_kwh * params[_P_FLAT_RATE]
+            # Taxed from the first tier up, as in _tax_kernel
+            start = cumulative_before
+            if tax_rate.shape[0]:
+                start = max(start, tax_lower[0])
+            for t in range(tax_rate.shape[0]):
+                kwh_in_tier = min(start + interval_kwh, tax_upper[t]) - max(
+                    start, tax_lower[t]
+                )
+                if kwh_in_tier > 0:
+                    cost += kwh_in_tier * tax_rate[t]
+            out[i] = cost + cc_per_interval
+        else:
+            out[i] = 0.0
+        cumulative_before = cumulative_after
+
+
+def _tiered_cost_array(
+    kwh: np.ndarray,
+    cumulative_before: np.ndarray,
+    tiered_rate: TieredRate,
+) -> np.ndarray:
+    """Apply _period_kernel with the constants of a TieredRate."""
+    return _period_kernel(
+        kwh,
+        cumulative_before,
+        float(tiered_rate.boundary_kwh),
+        tiered_rate.rate_under,
+        tiered_rate.rate_over,
     )
-    gen_cost = calculate_tiered_cost(interval_kwh, cumulative_before, gen_rate)
 
-    # Transmission (flat)
-    trans_cost = interval_kwh * schedule.transmission_rate
 
-    # Riders (flat per kWh)
-    rider_cost = sum(rider.rate * interval_kwh for rider in schedule.riders)
+def _energy_cost_array(
+    kwh: np.ndarray,
+    cumulative_before: np.ndarray,
+    dist_rate: TieredRate,
+    gen_rate: TieredRate,
+) -> np.ndarray:
+    """Distribution plus generation cost of each interval."""
+    combined = _combined_tiered_rate(dist_rate, gen_rate)
+    if combined is not None:
+        return _tiered_cost_array(kwh, cumulative_before, combined)
+    return _tiered_cost_array(kwh, cumulative_before, dist_rate) + _tiered_cost_array(
+        kwh, cumulative_before, gen_rate
+    )
 
-    # Consumption tax (tiered)
-    tax_cost = calculate_consumption_tax(
-        interval_kwh, cumulative_before, schedule.consumption_tax_tiers
+
+def calculate_schedule1_period_cost(
+    kwh_array: np.ndarray | memoryview | array[float] | Sequence[float],
+    start_dt: datetime,
+    schedule: RateSchedule,
+    billing_period_days: int = 30,
+    cumulative_start: float = 0.0,
+    out: np.ndarray | memoryview | array[float] | None = None,
+) -> np.ndarray:
+    """Calculate Schedule 1 cost for consecutive 30-minute intervals at once.
+
+    Vectorized equivalent of calling calculate_schedule1_interval_cost for each
+    interval while accumulating kWh between calls.
+
+    Args:
+        kwh_array: kWh consumed in each interval, in chronological order.
+        start_dt: Timestamp of the first interval (intervals are assumed to be
+            contiguous and 30 minutes apart).
+        schedule: The rate schedule to use.
+        billing_period_days: Length of billing period in days (for prorating customer charge).
+        cumulative_start: Total kWh consumed in the billing period before the first interval.
+        out: Optional writable float64 buffer to receive the per-interval costs.
+
+    Returns:
+        Array of per-interval costs in dollars (a view of out when given).
+    """
+    kwh = np.asarray(kwh_array, dtype=np.float64)
+    return calculate_schedule1_period_cost_by_month(
+        kwh,
+        _interval_months(start_dt, kwh.size),
+        schedule,
+        billing_period_days,
+        cumulative_start,
+        out,
+    )
+
+
+def calculate_schedule1_period_cost_by_month(
+    kwh_array: np.ndarray | memoryview | array[float] | Sequence[float],
+    months: int | np.ndarray | Sequence[int],
+    schedule: RateSchedule,
+    billing_period_days: int = 30,
+    cumulative_start: float = 0.0,
+    out: np.ndarray | memoryview | array[float] | None = None,
+) -> np.ndarray:
+    """Calculate Schedule 1 cost for a sequence of 30-minute intervals at once.
+
+    Same as calculate_schedule1_period_cost, but takes the month of each
+    interval directly, so intervals need not be contiguous.
+
+    kWh and output buffers of float64 (e.g. array('d') or a memoryview of one)
+    are used in place without copying.
+
+    Args:
+        kwh_array: kWh consumed in each interval, in chronological order.
+        months: Month (1-12) of each interval, or a single month for all of them.
+        schedule: The rate schedule to use.
+        billing_period_days: Length of billing period in days (for prorating customer charge).
+        cumulative_start: Total kWh consumed in the billing period before the first interval.
+        out: Optional writable float64 buffer to receive the per-interval costs.
+
+    Returns:
+        Array of per-interval costs in dollars (a view of out when given).
+
+    Raises:
+        ValueError: If out is not a writable float64 buffer of the same length.
+    """
+    kwh = np.asarray(kwh_array, dtype=np.float64)
+    if out is None:
+        result = np.empty_like(kwh)
+    else:
+        result = np.asarray(out)
+        if (
+            result.shape != kwh.shape
+            or result.dtype != np.float64
+            or not result.flags.writeable
+        ):
+            raise ValueError(
+                "out must be a writable float64 buffer with one entry per interval"
+            )
+    months = np.asarray(months)
+    summer = np.broadcast_to((months >= 6) & (months <= 9), kwh.shape)
+    customer_charge_per_interval = (
+        schedule._customer_charge_per_interval_base / billing_period_days
     )
 
-    # Prorated customer charge: $7.58/month spread across all intervals
-    # 48 intervals/day * billing_period_days
-    intervals_in_period = 48 * billing_period_days
-    customer_charge_per_interval = schedule.customer_charge / intervals_in_period
-
-    return (
-        dist_cost
-        + gen_cost
-        + trans_cost
-        + rider_cost
-        + tax_cost
-        + customer_charge_per_interval
+    if _HAS_NUMBA:
+        _schedule1_native_kernel(
+            kwh,
+            summer,
+            float(cumulative_start),
+            schedule._hot,
+            schedule._tax_lower,
+            schedule._tax_upper,
+            schedule._tax_rate,
+            customer_charge_per_interval,
+            result,
+        )
+        return result
+
+    cumulative_after = np.cumsum(kwh) + cumulative_start
+    cumulative_before = cumulative_after - kwh
+
+    # Distribution and generation (tiered, seasonal)
+    energy_cost = np.where(
+        summer,
+        _energy_cost_array(kwh, cumulative_before, *_seasonal_rates(schedule, True)),
+        _energy_cost_array(kwh, cumulative_before, *_seasonal_rates(schedule, False)),
     )
+
+    # Transmission and riders (flat per kWh)
+    flat_cost = kwh * schedule._flat_rate_per_kwh
+
+    # Consumption tax (tiered)
+    tax_cost = _tax_kernel(
+        kwh,
+        cumulative_before,
+        schedule._tax_lower,
+        schedule._tax_upper,
+        schedule._tax_rate,
+    )
+
+    total = energy_cost + flat_cost + tax_cost + customer_charge_per_interval
+    # Intervals without consumption carry no cost (matches the per-interval API)
+    result[...] = np.where(kwh > 0, total, 0.0)
+    return result